@@ -4,6 +4,7 @@
 '''
 
 import fitz
+from operator import itemgetter
 from .Element import Element
 from .share import (IText, TextDirection)
 from .algorithm import (solve_rects_intersection, graph_bfs)
@@ -15,8 +16,14 @@ class BaseCollection:
         '''Init collection from a list of instances.'''
         self._parent = parent
         self._instances = []
+        self._reset_cache()
         self.extend(instances or []) # Note to exclude empty instance by default
 
+    def _reset_cache(self):
+        '''Invalidate cached properties. It's called once any contained instance changes.'''
+        self._text_direction = None
+        self._physical_rows = None
+
     def __getitem__(self, idx):
         try:
             instances = self._instances[idx]
@@ -43,9 +50,10 @@ class BaseCollection:
         return fitz.Rect([round(x,1) for x in rect]) # NOTE: round to avoid digital error
 
 
-    def append(self, instance): 
+    def append(self, instance):
         if not instance: return
         self._instances.append(instance)
+        self._reset_cache()
 
 
     def extend(self, instances:list): 
@@ -63,6 +71,7 @@ class BaseCollection:
             BaseCollection: self
         """
         self._instances = []
+        self._reset_cache()
         self.extend(instances or [])
         return self
 
@@ -82,9 +91,19 @@ class Collection(BaseCollection, IText):
     
     @property
     def text_direction(self):
-        '''Get text direction. All instances must have same text direction.''' 
-        res = set(instance.text_direction for instance in self._instances)
-        return list(res)[0] if len(res)==1 else TextDirection.MIX 
+        '''Get text direction. All instances must have same text direction.
+        The result is cached and invalidated once contained instances change.'''
+        if self._text_direction is None:
+            res = None
+            for instance in self._instances:
+                direction = instance.text_direction
+                if res is None:
+                    res = direction
+                elif direction != res: # mixed direction -> no need to check further
+                    res = TextDirection.MIX
+                    break
+            self._text_direction = res if res is not None else TextDirection.MIX
+        return self._text_direction
 
 
     def group(self, fun):
@@ -158,7 +177,7 @@ class Collection(BaseCollection, IText):
             i_rect_x.append((i,   points, points[0]))
             i_rect_x.append((i+1, points, points[2]))
             i += 2
-        i_rect_x.sort(key=lambda item: item[-1])
+        i_rect_x.sort(key=itemgetter(-1))
         solve_rects_intersection(i_rect_x, 2*num, index_groups)
 
         # search graph -> grouped index of instance
@@ -196,15 +215,26 @@ class Collection(BaseCollection, IText):
 
 
     def group_by_physical_rows(self, sorted:bool=False, text_direction:bool=False):
-        '''Group lines into physical rows.'''
+        '''Group lines into physical rows.
+
+        .. note::
+            The default-argument result is cached, since it's requested many times
+            per block during parsing while the collection stays unchanged; it's
+            invalidated once contained instances change.
+        '''
+        default_args = not sorted and not text_direction
+        if default_args and self._physical_rows is not None:
+            return self._physical_rows
+
         fun = lambda a,b: a.in_same_row(b)
         groups = self.group(fun)
 
         # increase in y-direction if sort
-        if sorted: 
+        if sorted:
             idx = 0 if text_direction and self.is_vertical_text else 1
             groups.sort(key=lambda group: group.bbox[idx])
 
+        if default_args: self._physical_rows = groups
         return groups
 
 
@@ -272,9 +302,10 @@ class ElementCollection(Collection):
         if not e: return
         self._instances.append(e)
         self._update_bbox(e)
+        self._reset_cache()
 
         # set parent
-        if not self._parent is None: e.parent = self._parent 
+        if not self._parent is None: e.parent = self._parent
 
 
     def insert(self, nth:int, e:Element):
@@ -287,6 +318,7 @@ class ElementCollection(Collection):
         if not e: return
         self._instances.insert(nth, e)
         self._update_bbox(e)
+        self._reset_cache()
         e.parent = self._parent # set parent
 
     
@@ -298,7 +330,8 @@ class ElementCollection(Collection):
 
         Returns:
             Collection: the removed instance.
-        """        
+        """
+        self._reset_cache()
         return self._instances.pop(nth)
 
 
@@ -316,9 +349,11 @@ class ElementCollection(Collection):
         # group in physical row and check distance between lines
         idx0, idx1 = (0, 2) if self.is_horizontal_text else (3, 1)
         for row in self.group_by_physical_rows(text_direction=True):
-            for i in range(1, len(row)):
-                dis = abs(row[i].bbox[idx0]-row[i-1].bbox[idx1])
-                if dis >= line_separate_threshold: return False
+            ref = row[0].bbox[idx1]
+            for line in row[1:]:
+                bbox = line.bbox
+                if abs(bbox[idx0]-ref) >= line_separate_threshold: return False
+                ref = bbox[idx1]
 
         return True
 
@@ -3,6 +3,7 @@
 '''docx operation methods based on ``python-docx``.
 '''
 
+import logging
 from docx.shared import Pt
 from docx.oxml import OxmlElement, parse_xml, register_element_cls
 from docx.oxml.ns import qn, nsdecls
@@ -258,7 +259,7 @@ def add_image(p, image_path_or_stream, width, height):
     try:
         docx_span.add_picture(image_path_or_stream, width=Pt(width), height=Pt(height))
     except UnrecognizedImageError:
-        print('Unrecognized Image.')
+        logging.warning('Ignore unrecognized image.')
         return
     
     # exactly line spacing will destroy image display, so set single line spacing instead
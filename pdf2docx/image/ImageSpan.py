@@ -10,6 +10,9 @@ from .Image import Image
 class ImageSpan(Image):
     '''Image span.'''
 
+    # cheap type discriminator to avoid isinstance() in hot loops
+    is_image = True
+
     def intersects(self, rect):
         '''Create new ImageSpan object with image contained in given bbox.
         
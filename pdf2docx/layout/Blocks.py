@@ -130,10 +130,9 @@ class Blocks(ElementCollection):
         if not self._instances: return
 
         # convert to lines
-        instances = []
-        for block in self._instances:
-            if not isinstance(block, (ImageBlock, TextBlock)): continue
-            instances.extend(block.lines)
+        instances = [line for block in self._instances \
+                        if isinstance(block, (ImageBlock, TextBlock)) \
+                        for line in block.lines]
         
         # delete invalid lines
         page_bbox = self.parent.working_bbox
@@ -123,8 +123,10 @@ class CellStructure:
         # otherwise, set empty stroke here and let adjacent cells set the correct style separately
         if len(border_strokes)==1: return border_strokes[0]
 
-        properties = set([stroke.color for stroke in border_strokes])
-        return border_strokes[0] if len(properties)==1 else Stroke()
+        ref_color = border_strokes[0].color
+        for stroke in border_strokes[1:]:
+            if stroke.color != ref_color: return Stroke()
+        return border_strokes[0]
 
 
 class TableStructure:
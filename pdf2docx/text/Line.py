@@ -25,7 +25,6 @@ from .TextSpan import TextSpan
 from ..common.Element import Element
 from ..common.share import TextDirection
 from .Spans import Spans
-from ..image.ImageSpan import ImageSpan
 
 
 class Line(Element):
@@ -80,9 +79,7 @@ class Line(Element):
     @property
     def image_spans(self):
         '''Get image spans in this Line.'''
-        return list(filter(
-            lambda span: isinstance(span, ImageSpan), self.spans
-        ))
+        return [span for span in self.spans if span.is_image]
 
 
     @property
@@ -172,7 +169,21 @@ class Line(Element):
             for _ in range(self.tab_stop): p.add_run().add_tab()
 
         # create span -> run in paragraph
-        for span in self.spans: span.make_docx(p)            
+        # NOTE: consecutive text spans sharing a same style are merged into one run,
+        # so fewer oxml elements are created for text-heavy lines
+        ref_span, texts = None, []
+        for span in self.spans:
+            if span.is_image:
+                if ref_span is not None:
+                    ref_span.make_docx(p, text=''.join(texts))
+                    ref_span, texts = None, []
+                span.make_docx(p)
+            elif ref_span is not None and span.style_key==ref_span.style_key:
+                texts.append(span.text)
+            else:
+                if ref_span is not None: ref_span.make_docx(p, text=''.join(texts))
+                ref_span, texts = span, [span.text]
+        if ref_span is not None: ref_span.make_docx(p, text=''.join(texts))
 
         # line break
         if self.line_break: p.add_run('\n')
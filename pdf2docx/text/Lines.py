@@ -5,9 +5,9 @@
 
 
 import string
+import numpy as np
 from .Line import Line
 from .TextSpan import TextSpan
-from ..image.ImageSpan import ImageSpan
 from ..common.Collection import ElementCollection
 from ..common.share import TextAlignment
 from ..common import constants
@@ -16,6 +16,20 @@ from ..common import constants
 class Lines(ElementCollection):
     '''Collection of text lines.'''
 
+    def _reset_cache(self):
+        super()._reset_cache()
+        self._bbox_array = None
+
+    @property
+    def bbox_array(self):
+        '''Contiguous float32 array of shape (N,4) collecting all line bboxes, for
+        vectorized geometry checks. Lazily built and cached; invalidated once
+        contained lines change.'''
+        if self._bbox_array is None:
+            self._bbox_array = np.array([tuple(line.bbox) for line in self._instances],
+                dtype=np.float32).reshape(-1, 4)
+        return self._bbox_array
+
     @property
     def unique_parent(self):
         '''Whether all contained lines have same parant.'''
@@ -36,10 +50,7 @@ class Lines(ElementCollection):
     @property
     def image_spans(self):
         '''Get all ImageSpan instances.'''
-        spans = []
-        for line in self._instances:
-            spans.extend(line.image_spans)
-        return spans
+        return [span for line in self._instances for span in line.image_spans]
 
     
     def split_vertically_by_text(self, line_break_free_space_ratio:float, new_paragraph_free_space_ratio:float):
@@ -149,19 +160,30 @@ class Lines(ElementCollection):
             bool: Whether a valid text style.
         '''
         flag = False
-
-        for line in self._instances:
-            # any intersection in this line?
-            expanded_bbox = line.get_expand_bbox(constants.MAJOR_DIST)
-            if not shape.bbox.intersects(expanded_bbox): 
-                if shape.bbox.y1 < line.bbox.y0: break # lines must be sorted in advance
-                continue
-
-            # yes, then try to split the spans in this line
+        if not self._instances: return flag
+
+        # pre-filter intersected lines in vectorized form: compare the shape bbox
+        # against all line bboxes (expanded with tolerance) at a time, so only
+        # qualified lines go through the span splitting loop
+        dt = constants.MAJOR_DIST
+        bboxes = self.bbox_array
+        x0, y0, x1, y1 = shape.bbox
+        mask = (bboxes[:,0]-dt < x1) & (bboxes[:,2]+dt > x0) & \
+               (bboxes[:,1]-dt < y1) & (bboxes[:,3]+dt > y0)
+
+        # lines are sorted in advance, so exclude lines after the first one
+        # entirely below the shape -- same cut-off as a per-line early break
+        below = np.nonzero(bboxes[:,1] > y1)[0]
+        if below.size: mask[below[0]:] = False
+
+        for idx in np.nonzero(mask)[0]:
+            line = self._instances[idx]
+
+            # try to split the spans in this line
             split_spans = []
-            for span in line.spans: 
+            for span in line.spans:
                 # include image span directly
-                if isinstance(span, ImageSpan): split_spans.append(span)                   
+                if span.is_image: split_spans.append(span)
 
                 # split text span with the format rectangle: span-intersection-span
                 else:
@@ -257,6 +279,7 @@ class Lines(ElementCollection):
         # Note: it might need more than one tab stops
         # https://github.com/dothinking/pdf2docx/issues/157
         ref = block.bbox[idx0]
+        last_idx = len(self._instances) - 1
         for i, line in enumerate(self._instances):
             # left indentation implemented with tab
             distance = line.bbox[idx0] - ref
@@ -264,5 +287,5 @@ class Lines(ElementCollection):
                 line.tab_stop = tab_position(line.bbox[idx0])-tab_position(ref)
 
             # update stop reference position
-            if line==self._instances[-1]: break
+            if i==last_idx: break
             ref = line.bbox[idx1] if line.in_same_row(self._instances[i+1]) else block.bbox[idx0]
\ No newline at end of file
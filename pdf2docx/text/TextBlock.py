@@ -25,10 +25,10 @@ Data structure based on this `link <https://pymupdf.readthedocs.io/en/latest/tex
     }
 '''
 
+from functools import lru_cache
 from docx.shared import (Pt,Inches)
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from .Lines import Lines
-from ..image.ImageSpan import ImageSpan
 from ..common.share import (RectType, TextAlignment, lower_round)
 from ..common.Block import Block
 from ..common.share import (rgb_component_from_name, lower_round)
@@ -36,6 +36,22 @@ from ..common import constants
 from ..common import docx
 
 
+# alignment mode -> (docx alignment, whether to adjust left/right indentation);
+# looked up once per block instead of testing each mode in turn
+_ALIGNMENT_MODES = {
+    TextAlignment.LEFT  : (WD_ALIGN_PARAGRAPH.LEFT,   False, True),
+    TextAlignment.RIGHT : (WD_ALIGN_PARAGRAPH.RIGHT,  True,  False),
+    TextAlignment.CENTER: (WD_ALIGN_PARAGRAPH.CENTER, True,  True)
+}
+
+
+@lru_cache(maxsize=1024)
+def _pt(value):
+    '''Cached ``Pt()`` conversion. Spacing/indentation values are rounded before
+    converting, so identical values recur frequently across blocks.'''
+    return Pt(value)
+
+
 class TextBlock(Block):
     '''Text block.'''
     def __init__(self, raw:dict=None):
@@ -55,14 +71,12 @@ class TextBlock(Block):
     @property
     def text(self):
         '''Text content in block. Note image is counted as a placeholder ``<image>``.'''
-        lines_text = [line.text for line in self.lines]
-        return ''.join(lines_text)
+        return ''.join(line.text for line in self.lines)
 
     @property
     def raw_text(self):
         '''Raw text content in block without considering images.'''
-        lines_text = [line.raw_text for line in self.lines]
-        return ''.join(lines_text)
+        return ''.join(line.raw_text for line in self.lines)
 
     @property
     def white_space_only(self):
@@ -127,9 +141,9 @@ class TextBlock(Block):
         super().plot(page, stroke=blue, dashes='[3.0 3.0] 0')
 
         # lines and spans
+        red = rgb_component_from_name('red')
         for line in self.lines:
             # line border in red
-            red = rgb_component_from_name('red')
             line.plot(page, stroke=red)
 
             # span regions in random color
@@ -226,13 +240,14 @@ class TextBlock(Block):
         '''
         # return default line spacing if any images exists
         for line in self.lines:
-            if list(span for span in line.spans if isinstance(span, ImageSpan)):
+            if any(span.is_image for span in line.spans):
                 self.line_space = constants.DEFULT_LINE_SPACING
                 return
 
         # otherwise, calculate average line spacing
         idx = 1 if self.is_horizontal_text else 0
-        block_height = self.bbox[idx+2]-self.bbox[idx]
+        bbox = self.bbox
+        block_height = bbox[idx+2]-bbox[idx]
         
         # An approximate expression: 
         # standard_line_height * relative_line_spacing = block_height
@@ -260,11 +275,12 @@ class TextBlock(Block):
         '''
 
         # check text direction
-        idx = 1 if self.is_horizontal_text else 0       
+        idx = 1 if self.is_horizontal_text else 0
 
-        bbox = self.lines[0].bbox   # first line
-        first_line_height = bbox[idx+2] - bbox[idx]
-        block_height = self.bbox[idx+2]-self.bbox[idx]
+        first_line_bbox = self.lines[0].bbox   # first line
+        first_line_height = first_line_bbox[idx+2] - first_line_bbox[idx]
+        bbox = self.bbox
+        block_height = bbox[idx+2]-bbox[idx]
         
         # average line spacing
         count = self.row_count # count of rows
@@ -306,12 +322,12 @@ class TextBlock(Block):
         # ------------------------------------
         before_spacing = max(round(self.before_space, 1), 0.0)
         after_spacing = max(round(self.after_space, 1), 0.0)
-        pf.space_before = Pt(before_spacing)
-        pf.space_after = Pt(after_spacing)        
+        pf.space_before = _pt(before_spacing)
+        pf.space_after = _pt(after_spacing)        
 
         # line spacing
         if self.line_space_type==0: # exact line spacing
-            pf.line_spacing = Pt(min(round(self.line_space, 1) - 1, 11)) # an
+            pf.line_spacing = _pt(min(round(self.line_space, 1) - 1, 11)) # an
         else: # relative line spacing
             pf.line_spacing = round(self.line_space, 2)
 
@@ -324,41 +340,33 @@ class TextBlock(Block):
         if self.first_line_space<0: # in case hanging
             left_space -= self.first_line_space           
         
-        pf.left_indent  = Pt(left_space)
-        pf.right_indent  = Pt(self.right_space)
-        pf.first_line_indent = Pt(self.first_line_space)
+        pf.left_indent  = _pt(left_space)
+        pf.right_indent  = _pt(self.right_space)
+        pf.first_line_indent = _pt(self.first_line_space)
 
         # (2) set alignment mode and adjust indentation:
         # round indention on the opposite side to lower bound (inches), so it saves more space to 
         # avoid unexpected line break
-        if self.alignment==TextAlignment.LEFT:
-            pf.alignment = WD_ALIGN_PARAGRAPH.LEFT            
+        mode = _ALIGNMENT_MODES.get(self.alignment)
+        if mode is None:
+            pf.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        else:
+            pf.alignment, adjust_left, adjust_right = mode
+
             # set tab stops to ensure line position
-            for pos in self.tab_stops:
-                pf.tab_stops.add_tab_stop(Pt(self.left_space + pos))
-            
-            # adjust right indent
-            d = lower_round(self.right_space/constants.ITP, 1)
-            pf.right_indent = Inches(d)
+            if self.alignment==TextAlignment.LEFT:
+                for pos in self.tab_stops:
+                    pf.tab_stops.add_tab_stop(_pt(self.left_space + pos))
 
-        elif self.alignment==TextAlignment.RIGHT:
-            pf.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            
             # adjust left indent
-            d = lower_round(left_space/constants.ITP, 1)
-            pf.left_indent = Inches(d)
-
-        elif self.alignment==TextAlignment.CENTER:
-            pf.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            # adjust both left and right indent
-            d = lower_round(left_space/constants.ITP, 1)
-            pf.left_indent = Inches(d)
-            d = lower_round(self.right_space/constants.ITP, 1)
-            pf.right_indent = Inches(d)
+            if adjust_left:
+                d = lower_round(left_space/constants.ITP, 1)
+                pf.left_indent = Inches(d)
 
-        else:
-            pf.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+            # adjust right indent
+            if adjust_right:
+                d = lower_round(self.right_space/constants.ITP, 1)
+                pf.right_indent = Inches(d)
 
         # ------------------------------------
         # add lines
@@ -386,12 +394,16 @@ class TextBlock(Block):
         idx0, idx1, f = text_direction_param
 
         # check external position: text block to parent layout
-        d_left   = round((self.bbox[idx0]-bbox[idx0])*f, 1) # left margin
-        d_right  = round((bbox[idx1]-self.bbox[idx1])*f, 1) # right margin
-        d_center = round((d_left-d_right)/2.0, 1)           # center margin
+        # NOTE: read coordinates into locals first -- each subscript on fitz.Rect
+        # is a C-API call
+        x0, x1 = self.bbox[idx0], self.bbox[idx1] # text block
+        px0, px1 = bbox[idx0], bbox[idx1]         # parent layout
+        d_left   = round((x0-px0)*f, 1)           # left margin
+        d_right  = round((px1-x1)*f, 1)           # right margin
+        d_center = round((d_left-d_right)/2.0, 1) # center margin
         d_left   = max(d_left, 0.0)
         d_right  = max(d_right, 0.0)
-        W = abs(bbox[idx1]-bbox[idx0]) # bbox width
+        W = abs(px1-px0) # bbox width
 
         # NOTE: set horizontal space
         self.left_space  = d_left
@@ -405,10 +417,12 @@ class TextBlock(Block):
         rows = self.lines.group_by_physical_rows() # lines in each physical row
         for row in rows:
             if len(row)==1: continue
-            dis = [(row[i].bbox[idx0]-row[i-1].bbox[idx1])*f>=line_separate_threshold \
-                        for i in range(1, len(row))]
-            if any(dis):
-                return TextAlignment.NONE
+            ref = row[0].bbox[idx1]
+            for line in row[1:]:
+                bbox = line.bbox
+                if (bbox[idx0]-ref)*f >= line_separate_threshold:
+                    return TextAlignment.NONE
+                ref = bbox[idx1]
 
         # --------------------------------------------------------------------------
         # determined by position to external bbox if one line only
@@ -438,14 +452,28 @@ class TextBlock(Block):
         # =========   =========     =======  |
         # ======      =========     =====    |
         # --------------------------------------------------------------------------
-        X0 = [lines[0].bbox[idx0]  for lines in rows]
-        X1 = [lines[-1].bbox[idx1] for lines in rows]
-        X  = [(x0+x1)/2.0 for (x0, x1) in zip(X0, X1)]
-
-        if len(rows) >= 3: X0, X1 = X0[1:], X1[0:-1]
-        left_aligned   = abs(max(X0)-min(X0))<=lines_left_aligned_threshold
-        right_aligned  = abs(max(X1)-min(X1))<=lines_right_aligned_threshold
-        center_aligned = abs(max(X)-min(X))<=lines_center_aligned_threshold # coarse margin for center alignment
+        # track min/max of left/right/center positions in a single pass over rows;
+        # exclude the first row for left and the last row for right when count of
+        # rows >= 3, as illustrated above
+        num = len(rows)
+        x0_min = x1_min = xc_min = float('inf')
+        x0_max = x1_max = xc_max = -float('inf')
+        for i, lines in enumerate(rows):
+            x0 = lines[0].bbox[idx0]
+            x1 = lines[-1].bbox[idx1]
+            xc = (x0+x1)/2.0
+            if not (num>=3 and i==0):
+                if x0<x0_min: x0_min = x0
+                if x0>x0_max: x0_max = x0
+            if not (num>=3 and i==num-1):
+                if x1<x1_min: x1_min = x1
+                if x1>x1_max: x1_max = x1
+            if xc<xc_min: xc_min = xc
+            if xc>xc_max: xc_max = xc
+
+        left_aligned   = abs(x0_max-x0_min)<=lines_left_aligned_threshold
+        right_aligned  = abs(x1_max-x1_min)<=lines_right_aligned_threshold
+        center_aligned = abs(xc_max-xc_min)<=lines_center_aligned_threshold # coarse margin for center alignment
 
         if left_aligned and right_aligned:
             # need further external check if two lines only
@@ -42,6 +42,9 @@ from ..shape.Shape import Shape
 
 class TextSpan(Element):
     '''Object representing text span.'''
+
+    # cheap type discriminator to avoid isinstance() in hot loops
+    is_image = False
     def __init__(self, raw:dict=None):
         raw = raw or {}
         self.color = raw.get('color', 0)
@@ -97,6 +100,13 @@ class TextSpan(Element):
     @property
     def is_valid_line_height(self): return self.line_height!=-1
 
+    @property
+    def style_key(self):
+        '''Hashable key of text style. Adjacent spans sharing a same key can be merged
+        into one docx run.'''
+        return (self.font, self.size, self.flags, self.color, self.char_spacing,
+            tuple((style['type'], style['color'], style.get('uri')) for style in self.style))
+
 
     def _change_font_and_update_bbox(self, font_name:str):
         '''Set new font, and update font size, span/char bbox accordingly.
@@ -360,21 +370,28 @@ class TextSpan(Element):
         return span
 
 
-    def make_docx(self, paragraph):
+    def make_docx(self, paragraph, text:str=None):
         '''Add text span to a docx paragraph, and set text style, e.g. font, color, underline, hyperlink, etc.
 
+        Args:
+            paragraph (Paragraph): ``python-docx`` paragraph instance.
+            text (str, optional): Override of run text, e.g. the joined text of consecutive
+                spans sharing a same style. Defaults to this span's text.
+
         .. note::
             Hyperlink and its style is parsed separately from pdf. For instance, regarding a general hyperlink with an
             underline, the text and uri is parsed as hyperlink itself, while the underline is treated as a normal text
             style.
         '''
+        if text is None: text = self.text
+
         # Create hyperlink in particular, otherwise add a run directly
         for style in self.style:
-            if style['type']==RectType.HYPERLINK.value and self.text.strip():
-                docx_run = docx.add_hyperlink(paragraph, style['uri'], self.text)
+            if style['type']==RectType.HYPERLINK.value and text.strip():
+                docx_run = docx.add_hyperlink(paragraph, style['uri'], text)
                 break
         else:
-            docx_run = paragraph.add_run(self.text)
+            docx_run = paragraph.add_run(text)
         
         # set text style, e.g. font, underline and highlight
         self._set_text_format(docx_run)